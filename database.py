@@ -8,22 +8,41 @@ from user import User
 BASE_DIR = Path().resolve()
 DATABASE = 'user.db'
 DATABASE_PATH = BASE_DIR / DATABASE
-DATE_TODAY = str(datetime.date.today())
 
 logger = logging.getLogger(__name__)
+_connection = None
 
 
 def create_connection():
-    """Creates connection to the provided database and returns it. Exception logged if connection cannot be formed."""
+    """Returns the connection to the database, forming it on first use. Exception logged if connection cannot be formed.
+
+    The connection is kept open for the life of the application, so SQLite's per-connection statement cache lets
+    repeated statements skip parsing and planning. It uses write-ahead logging with normal synchronisation, so a commit
+    does not wait on a full fsync of the database file.
+    """
+    global _connection
+    if _connection is not None:
+        return _connection
     try:
         connection = sqlite3.connect(DATABASE)
+        connection.execute('PRAGMA journal_mode = WAL')
+        connection.execute('PRAGMA synchronous = NORMAL')
     except sqlite3.DatabaseError:
         logger.exception('Exception occurred.')
     else:
+        _connection = connection
         return connection
     return None
 
 
+def close_connection():
+    """Closes the cached database connection, if one has been formed."""
+    global _connection
+    if _connection is not None:
+        _connection.close()
+        _connection = None
+
+
 def execute_sql_statement(connection, sql_statement, params):
     """Executes SQL statement with database connection. Exception logged if execution cannot be performed."""
     if connection is not None:
@@ -46,12 +65,43 @@ def execute_sql_statement(connection, sql_statement, params):
                 logger.exception('Database integrity exception occurred.')
                 connection.rollback()
                 return
-            finally:
-                connection.close()
     else:
         return None
 
 
+def execute_insert_sql_statement(connection, sql_statement, params):
+    """Executes SQL insert statement and returns the ID of the inserted row. Exception logged and None returned if
+    execution cannot be performed."""
+    if connection is not None:
+        try:
+            cursor = connection.execute(sql_statement, params)
+            connection.commit()
+        except sqlite3.ProgrammingError:
+            logger.exception('Database programming exception occurred.')
+            connection.rollback()
+        except sqlite3.IntegrityError:
+            logger.exception('Database integrity exception occurred.')
+            connection.rollback()
+        else:
+            return cursor.lastrowid
+    return None
+
+
+def execute_many_sql_statement(connection, sql_statement, params_list):
+    """Executes SQL statement for every parameter set in a single transaction. Exception logged and the transaction
+    rolled back if execution cannot be performed."""
+    if connection is not None:
+        try:
+            connection.executemany(sql_statement, params_list)
+            connection.commit()
+        except sqlite3.ProgrammingError:
+            logger.exception('Database programming exception occurred.')
+            connection.rollback()
+        except sqlite3.IntegrityError:
+            logger.exception('Database integrity exception occurred.')
+            connection.rollback()
+
+
 def create_user_tables():
     """Constructs USER and WEIGHT_HISTORY SQLite tables.
 
@@ -89,8 +139,10 @@ def retrieve_user(user_id):
     :param user_id: the user ID to query the database
     :return: None or USER Object
     """
-    db = sqlite3.connect(DATABASE)
-    cur = db.cursor()
+    connection = create_connection()
+    if connection is None:
+        return None
+    cur = connection.cursor()
     user = cur.execute("SELECT USER_ID from USER where USER_ID = ?", (user_id,))
     if user.fetchone() is None:
         return None
@@ -124,17 +176,36 @@ def dupretrieve_user(user_id):
 
 
 def insert_user(user):
-    """Inserts the user object into the database with the object's attributes as parameters."""
-    db = sqlite3.connect(DATABASE)
-    cur = db.cursor()
-    cur.execute('''
-    INSERT INTO USER (NAME,WEIGHT,GOAL,HEIGHT) 
-        VALUES (?,?,?,?)''', (user.name, user.weight, user.goal, user.height))
-    cur.execute('''
-    INSERT INTO WEIGHT_HISTORY (DATE, WEIGHT, PERSON_ID)
-        VALUES (?,?,?)''', (DATE_TODAY, user.weight, user.user_id))
-    db.commit()
-    db.close()
+    """
+    Inserts the user object into the database with the object's attributes as parameters, along with a first weight
+    history entry for today. Both rows are inserted in one transaction, so an exception is logged and neither row is
+    kept if either insert fails. The user's ID and weight history are set from the inserted rows.
+    :param user: the user object to insert
+    :return: None or USER Object
+    """
+    connection = create_connection()
+    if connection is None:
+        return None
+    user_statement = (''' INSERT INTO USER 
+                          (NAME,WEIGHT,GOAL,HEIGHT) 
+                          VALUES (?,?,?,?)''')
+    history_statement = (''' INSERT INTO WEIGHT_HISTORY 
+                             (DATE, WEIGHT, PERSON_ID)
+                             VALUES (?,?,?)''')
+    date = datetime.date.today().isoformat()
+    try:
+        user_id = connection.execute(user_statement, (user.name, user.weight, user.goal, user.height)).lastrowid
+        entry_id = connection.execute(history_statement, (date, user.weight, user_id)).lastrowid
+        connection.commit()
+    except sqlite3.Error:
+        # Any failure, including a locked database, must not leave the USER insert pending in the open transaction
+        logger.exception('Database exception occurred while inserting the user.')
+        connection.rollback()
+    else:
+        user.user_id = user_id
+        user.set_weight_history([(entry_id, date, user.weight)])
+        return user
+    return None
 
 
 def dupinsert_user(user):
@@ -146,7 +217,9 @@ def dupinsert_user(user):
     sql_statement = (''' INSERT INTO WEIGHT_HISTORY 
                          (DATE, WEIGHT, PERSON_ID)
                          VALUES (?,?,?)''')
-    execute_sql_statement(create_connection(), sql_statement, (DATE_TODAY, user.weight, user.user_id))
+    execute_sql_statement(
+        create_connection(), sql_statement, (datetime.date.today().isoformat(), user.weight, user.user_id)
+    )
 
 
 def load_user_history(user):
@@ -190,11 +263,11 @@ def update_user_height(params):
 
 
 def insert_weight_entry(date, weight, person_id):
-    """Inserts a new entry into the database with the date and weight provided."""
+    """Inserts a new entry into the database with the date and weight provided and returns the new entry's ID."""
     sql_statement = (''' INSERT INTO WEIGHT_HISTORY 
                          (DATE, WEIGHT, PERSON_ID) 
                          VALUES (?,?,?)''')
-    execute_sql_statement(create_connection(), sql_statement, (date, weight, person_id))
+    return execute_insert_sql_statement(create_connection(), sql_statement, (date, weight, person_id))
 
 
 def update_weight_entry(entry_id, weight, date):
@@ -203,12 +276,11 @@ def update_weight_entry(entry_id, weight, date):
                          SET WEIGHT = ?,
                             DATE = ? 
                          WHERE ID = ?''')
-    execute_sql_statement(create_connection(), sql_statement, (entry_id, weight, date))
+    execute_sql_statement(create_connection(), sql_statement, (weight, date, entry_id))
 
 
 def delete_weight_entry(entries):
-    """Deletes the entry in the WEIGHT_HISTORY table that matches the ID parameter."""
+    """Deletes the entries in the WEIGHT_HISTORY table that match the IDs provided in a single transaction."""
     sql_statement = (''' DELETE from WEIGHT_HISTORY 
                          WHERE ID = ?''')
-    for entry in entries:
-        execute_sql_statement(create_connection(), sql_statement, (entry,))
+    execute_many_sql_statement(create_connection(), sql_statement, [(entry,) for entry in entries])
@@ -79,14 +79,16 @@ QTAPP = QApplication(sys.argv)
 
 
 def main():
-    if DATABASE_PATH.exists() is False:
+    if not DATABASE_PATH.exists():
         database.create_user_tables()
         user = None
     else:
         user = database.retrieve_user(user_id=1)
 
     appgui = GUIManager(user)
-    sys.exit(QTAPP.exec())
+    exit_code = QTAPP.exec()
+    database.close_connection()
+    sys.exit(exit_code)
 
 
 if __name__ == '__main__':
@@ -4,10 +4,12 @@ import sys
 from functools import partial
 from pathlib import Path
 
-import pyqtgraph as pg
-from PyQt6.QtCore import *
-from PyQt6.QtGui import *
-from PyQt6.QtWidgets import *
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QDoubleValidator, QIcon, QPixmap
+from PyQt6.QtWidgets import (
+    QButtonGroup, QCalendarWidget, QDialog, QGridLayout, QGroupBox, QHBoxLayout, QHeaderView, QLabel, QLineEdit,
+    QMainWindow, QMenu, QMenuBar, QPushButton, QRadioButton, QSizePolicy, QTableView, QVBoxLayout, QWidget
+)
 
 import database
 import model
@@ -16,10 +18,78 @@ from user import User
 
 BASE_DIR = Path().resolve()
 MEDIA_DIR = BASE_DIR / 'media'
-DATETODAY = datetime.date.today()
+SIZE_POLICY = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Minimum)
+BMI_TOOLTIP = (
+    'BMI is a convenient rule of thumb for categorizing a person as underweight, normal, overweight, or obese.'
+    '\nWhile helpful broadly across the population, it can fail to account for a person that is very athletic.'
+    '\nA person with a lot of muscle may skew towards being overweight or even obese on the BMI scale.'
+)
+# Tooltips for the net change, weight change, days to goal and end date metrics, in display order
+METRIC_TOOLTIPS = (
+    'The total weight change you have experienced.',
+    'The average weight change you have experienced per entry.',
+    'The amount of days left until you reach your goal should the trajectory of your weight progression '
+    'remain the same.',
+    'The date upon which you will reach your end goal should the trajectory of your weight progression '
+    'remain the same.',
+)
+WELCOME_TEXT = (
+    'Welcome to the Weight Tracker and Visualization tool!\n'
+    'Please input your personal details in the boxes below\n'
+    'These details will become the base of your history.\n'
+)
+GROUP_BOX_STYLE = '''
+QGroupBox {
+font-size: 16px;
+font-weight: bold;
+}
+
+QLabel {
+font: bold 14px
+}
+'''
+SETTINGS_BOX_STYLE = '''
+QGroupBox {
+font-size: 14px;
+font-weight: bold;
+}
+'''
+# Settings menu sections: the settings key, the group box title, and the (button text, value) options
+SETTINGS_SECTIONS = (
+    ('Measurement System', 'Select a Measurement System', (
+        ('Imperial', 'Imperial'), ('Metric', 'Metric'), ('British Imperial', 'British Imperial'),
+    )),
+    ('Theme', 'Select a menu theme', (
+        ('Light', 'Light'), ('Dark', 'Dark'),
+    )),
+    ('Default Graph Entry Range', 'Select the default graphing range to display', (
+        ('15 Entries', '15'), ('30 Entries', '30'), ('90 Entries', '90'), ('All', 'All'),
+    )),
+    ('Default Graph Future Range', 'Select the default behavior for graphing future entries', (
+        ('7 Entries', '7'), ('14 Entries', '14'), ('28 Entries', '28'), ('Off', 'Off'),
+    )),
+)
+HEADER_STYLE = '''
+QHeaderView::section {
+    border-radius:20px;
+    font-size:20px;
+    font-weight:bold;
+}
+'''
 
 logger = logging.getLogger(__name__)
 
+ICON_CACHE = {}
+
+
+def load_icon(name):
+    """Loads the named image from the media directory as a QIcon on first use and returns the cached icon after."""
+    icon = ICON_CACHE.get(name)
+    if icon is None:
+        icon = QIcon(QPixmap(str(MEDIA_DIR / name)))
+        ICON_CACHE[name] = icon
+    return icon
+
 
 class GUIManager(QWidget):
     """Overall manager for all GUI objects and app UI functions."""
@@ -31,18 +101,15 @@ class GUIManager(QWidget):
         """
         super().__init__()
         self.user = user
-        self.active_window = self.user_check()
-
-    def user_check(self):
         if self.user is None:
-            window = NewUserDialog(self)
-            return window
+            self.active_window = NewUserDialog(self)
         else:
-            window = MainMenu(self.user)
-            return window
+            self.active_window = MainMenu(self.user)
+            self.active_window.show()
 
     def create_main_menu(self, user):
         self.active_window = MainMenu(user)
+        self.active_window.show()
 
 
 class MainMenu(QMainWindow):
@@ -56,10 +123,14 @@ class MainMenu(QMainWindow):
         self.main_widget = MainWidget(self, self.user)
         self.setMenuBar(self.menu)
         self.setCentralWidget(self.main_widget)
-        self.show()
 
     def load_settings(self):
-        self.settings = Settings()
+        """
+        Refreshes the values derived from the settings after they have been changed in memory by the settings menu.
+        :return: None
+        """
+        self.settings.units = self.settings.set_units()
+        self.main_widget.load_settings()
 
 
 class MainMenuMenuBar(QMenuBar):
@@ -69,9 +140,8 @@ class MainMenuMenuBar(QMenuBar):
         self.parent = parent
         # file menu and actions
         self.file_menu = QMenu('File')
-        icon = QIcon(QPixmap('media/wrench.png'))
-        self.file_menu.addAction(icon, 'Settings', self.settings_slot)
-        self.file_menu.addAction('Close', self.close_slot)
+        self.file_menu.addAction(load_icon('wrench.png'), 'Settings', self.settings_slot)
+        self.file_menu.addAction('Close', sys.exit)
         # about menu and actions
         self.help_menu = QMenu('Help')
         self.help_menu.addAction('About', self.about_slot)
@@ -79,12 +149,18 @@ class MainMenuMenuBar(QMenuBar):
         self.addMenu(self.file_menu)
         self.addMenu(self.help_menu)
         self.dialog = None
+        self.settings_menu = None
 
     def settings_slot(self):
-        self.dialog = SettingsMenu(self.parent)
-
-    def close_slot(self):
-        sys.exit()
+        """
+        Shows the settings menu, creating it the first time it is opened and reusing it afterwards.
+        :return: None
+        """
+        if self.settings_menu is None:
+            self.settings_menu = SettingsMenu(self.parent)
+        self.settings_menu.show()
+        self.settings_menu.raise_()
+        self.settings_menu.activateWindow()
 
     def about_slot(self):
         self.dialog = AboutMenu(self.parent)
@@ -104,35 +180,40 @@ class MainWidget(QWidget):
         self.master = master
         self.user = user
         self.settings = self.master.settings
-        # data for objects
-        self.sorted_weight_list = model.convert_weight_history(
-            self.user.weight_history, self.settings.settings['Measurement System']
+        # Weights are stored in pounds and shown in this measurement system
+        self.measurement_system = self.settings.settings['Measurement System']
+        # data for objects, the table model owns the sorted weight history that the rest of the widget reads
+        self.history_model = model.WeightHistoryModel(
+            model.convert_weight_history(self.user.weight_history, self.measurement_system)
         )
-        self.table_list = model.create_table_list(self.sorted_weight_list)
-        self.weight_delta = model.weight_delta_calculator(self.sorted_weight_list)
-        self.time_goal_data = model.time_to_goal(self.sorted_weight_list[-1][2], self.user.goal, self.weight_delta)
+        self.update_data()
+        # Validators shared by every weight and height QLineEdit
+        self.weight_validator = QDoubleValidator(1, 2000, 2, self)
+        self.height_validator = QDoubleValidator(1, 200, 2, self)
         # Initializes widgets to display user metrics
         self.user_name = self.user_name_properties()
         self.user_weight = self.user_weight_properties()
         self.user_goal_weight = self.user_goal_weight_properties()
         self.user_height = self.user_height_properties()
-        self.user_bmi = self.user_bmi_properties()
+        self.user_bmi = self.readonly_line_properties(QLineEdit(), BMI_TOOLTIP, 50)
         self.user_box = self.user_box_properties()
-        self.net_change = self.net_weight_change()
-        self.weight_average = self.average_weight_change()
-        self.time_goal = self.time_to_goal()
-        self.end_date = self.end_date_properties()
+        self.net_change, self.weight_average, self.time_goal, self.end_date = (
+            self.readonly_line_properties(QLineEdit(), tooltip) for tooltip in METRIC_TOOLTIPS
+        )
         self.weight_box = self.weight_box_properties()
-        # Initializes a tree for displaying all user's weight history and buttons for editing DB
-        self.user_history = QTableWidget()
+        # Initializes a table for displaying all user's weight history and buttons for editing DB
+        self.user_history = self.user_history_properties()
         self.add_entry = self.add_entry_button()
-        self.modify_entry = QPushButton()
-        self.delete_entry = QPushButton()
-        self.weight_entry = QLineEdit()
+        self.modify_entry = self.modify_entry_button()
+        self.delete_entry = self.delete_entry_button()
+        self.entry_button_timer = self.entry_button_timer_properties()
+        self.weight_entry = self.weight_entry_edit()
         self.calendar = self.calendar_widget()
         # Initializes the graph for visualizing weight history with buttons for modifying display
-        self.graph_x, self.graph_y = model.create_graph_list(self.user.weight_history)
-        self.user_graph = self.user_graph_properties()
+        self._user_graph = None
+        self.weight_curve = None
+        self.lerp_curve = None
+        self.graph_placeholder = QWidget()
         self.graph_14_days_button = self.graph_14_days_btn()
         self.graph_28_days_button = self.graph_28_days_btn()
         self.graph_3_months_button = self.graph_3_months_btn()
@@ -140,44 +221,59 @@ class MainWidget(QWidget):
         self.lerp_14_days_button = self.lerp_14_days_btn()
         self.lerp_28_days_button = self.lerp_28_days_btn()
         self.graph_box = self.graph_box_properties()
-        # Sets the properties for all widgets and their layouts
-        self.set_widget_properties()
+        # Sets the values displayed by the widgets
         self.set_weight()
         self.set_goal()
+        self.update_bmi_factor()
         self.set_bmi()
         self.set_height()
         self.set_progress_metrics()
-        self.user_history_table(self.table_list)
-        # Initializes the layouts with a master layout
-        self.layout_left = self.generate_left_layout()
-        self.layout_center = self.generate_center_layout()
-        self.layout_right = self.generate_right_layout()
-        self.master_layout = self.generate_master_layout()
+        # Initializes the layouts with a master layout, holding back repaints until they are all in place
+        self.setUpdatesEnabled(False)
+        self.layout_left = self.generate_vertical_layout(self.user_box, self.weight_box)
+        self.layout_center = self.generate_vertical_layout(
+            self.user_history, self.add_entry, self.modify_entry, self.delete_entry, self.weight_entry, self.calendar
+        )
+        self.layout_right = self.generate_vertical_layout(self.graph_placeholder, self.graph_box)
+        self.master_layout = QHBoxLayout()
+        for column in (self.layout_left, self.layout_center, self.layout_right):
+            self.master_layout.addLayout(column, 1)
         self.setLayout(self.master_layout)
-        self.update_graph()
-        self.show()
+        self.setUpdatesEnabled(True)
+        # The first plot waits for the event loop so it is drawn once, at the geometry the widget is shown with
+        QTimer.singleShot(0, self.update_graph)
+
+    def readonly_line_properties(self, line, tooltip, minimum_width=75):
+        """
+        Applies the tooltip, read-only state, sizing and alignment shared by the user and metric QLineEdit objects.
+        :param line: the QLineEdit object to set up
+        :param tooltip: the tooltip text displayed for the line
+        :param minimum_width: the minimum width of the line
+        :return: QLineEdit
+        """
+        line.setToolTip(tooltip)
+        line.setReadOnly(True)
+        line.setMinimumSize(minimum_width, 15)
+        line.setMaximumSize(150, 25)
+        line.setSizePolicy(SIZE_POLICY)
+        line.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        return line
 
     def user_name_properties(self):
         """
         Sets the default properties of the name QLineEdit object.
         :return: None
         """
-        name = QLineSub()
-        name.setToolTip('Double-click to be able to enter a new name.')
+        name = self.readonly_line_properties(QLineSub(), 'Double-click to be able to enter a new name.', 50)
         name.setText(f'{self.user.name}')
-        name.setReadOnly(True)
-        sizepolicy = QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Minimum)
-        name.setMinimumSize(50, 15)
-        name.setMaximumSize(150, 25)
-        name.setSizePolicy(sizepolicy)
-        name.setAlignment(Qt.Alignment.AlignCenter)
-        name.editingFinished.connect(partial(self.update_name, name))
+        name.editingFinished.connect(self.update_name)
         return name
 
-    def update_name(self, qline):
-        database.update_user_name((qline.text(), self.user.user_id))
-        self.user.set_name(qline.text())
-        qline.setReadOnly(True)
+    def update_name(self):
+        name = self.user_name.text()
+        database.update_user_name((name, self.user.user_id))
+        self.user.set_name(name)
+        self.user_name.setReadOnly(True)
         self.set_name()
 
     def user_weight_properties(self):
@@ -185,25 +281,18 @@ class MainWidget(QWidget):
         Sets the default properties of the weight QLineEdit object.
         :return: None
         """
-        weight = QLineSub()
-        weight.setToolTip(
-            'The weight at which you started tracking. Double-click to change to a new value.'
+        weight = self.readonly_line_properties(
+            QLineSub(), 'The weight at which you started tracking. Double-click to change to a new value.', 50
         )
-        validator = QDoubleValidator(1, 2000, 2, weight)
-        weight.setValidator(validator)
-        weight.setReadOnly(True)
-        sizepolicy = QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Minimum)
-        weight.setMinimumSize(50, 15)
-        weight.setMaximumSize(150, 25)
-        weight.setSizePolicy(sizepolicy)
-        weight.setAlignment(Qt.Alignment.AlignCenter)
-        weight.editingFinished.connect(partial(self.update_startweight_db, weight))
+        weight.setValidator(self.weight_validator)
+        weight.editingFinished.connect(self.update_startweight_db)
         return weight
 
-    def update_startweight_db(self, qline):
-        database.update_user_weight((float(qline.text()), self.user.user_id))
-        self.user.set_weight(qline.text())
-        qline.setReadOnly(True)
+    def update_startweight_db(self):
+        weight = self.stored_weight(float(self.user_weight.text()))
+        database.update_user_weight((float(weight), self.user.user_id))
+        self.user.set_weight(weight)
+        self.user_weight.setReadOnly(True)
         self.set_weight()
 
     def user_goal_weight_properties(self):
@@ -211,25 +300,18 @@ class MainWidget(QWidget):
         Sets the default properties of the weight goal QLineEdit object.
         :return: None
         """
-        goal_weight = QLineSub()
-        goal_weight.setToolTip(
-            'The goal weight you are trying to achieve. Double-click to change to a new value.'
+        goal_weight = self.readonly_line_properties(
+            QLineSub(), 'The goal weight you are trying to achieve. Double-click to change to a new value.', 50
         )
-        goal_weight.setReadOnly(True)
-        validator = QDoubleValidator(1, 2000, 2, goal_weight)
-        goal_weight.setValidator(validator)
-        sizepolicy = QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Minimum)
-        goal_weight.setMinimumSize(50, 15)
-        goal_weight.setMaximumSize(150, 25)
-        goal_weight.setSizePolicy(sizepolicy)
-        goal_weight.setAlignment(Qt.Alignment.AlignCenter)
-        goal_weight.editingFinished.connect(partial(self.update_goalweight_db, goal_weight))
+        goal_weight.setValidator(self.weight_validator)
+        goal_weight.editingFinished.connect(self.update_goalweight_db)
         return goal_weight
 
-    def update_goalweight_db(self, qline):
-        database.update_user_goal((float(qline.text()), self.user.user_id))
-        self.user.set_goal_weight(qline.text())
-        qline.setReadOnly(True)
+    def update_goalweight_db(self):
+        goal = self.stored_weight(float(self.user_goal_weight.text()))
+        database.update_user_goal((float(goal), self.user.user_id))
+        self.user.set_goal_weight(goal)
+        self.user_goal_weight.setReadOnly(True)
         self.set_goal()
         self.update_time_delta()
         self.set_progress_metrics()
@@ -239,201 +321,86 @@ class MainWidget(QWidget):
         Sets the default properties of the height QLineEdit object.
         :return: None
         """
-        height = QLineSub()
-        height.setReadOnly(True)
-        height.setToolTip(
-            'Your height, which is utilized to calculate BMI. Double-click to change to a new value.'
+        height = self.readonly_line_properties(
+            QLineSub(), 'Your height, which is utilized to calculate BMI. Double-click to change to a new value.', 50
         )
-        validator = QDoubleValidator(1, 200, 2, height)
-        height.setValidator(validator)
-        sizepolicy = QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Minimum)
-        height.setMinimumSize(50, 15)
-        height.setMaximumSize(150, 25)
-        height.setSizePolicy(sizepolicy)
-        height.setAlignment(Qt.Alignment.AlignCenter)
-        height.editingFinished.connect(partial(self.update_height_db, height))
+        height.setValidator(self.height_validator)
+        height.editingFinished.connect(self.update_height_db)
         return height
 
-    def update_height_db(self, qline):
-        database.update_user_height((int(qline.text()), self.user.user_id))
-        self.user.set_height(qline.text())
-        qline.setReadOnly(True)
+    def update_height_db(self):
+        height = self.user_height.text()
+        database.update_user_height((int(height), self.user.user_id))
+        self.user.set_height(height)
+        self.user_height.setReadOnly(True)
         self.set_height()
-
-    def user_bmi_properties(self):
-        """
-        Sets the default properties of the BMI object.
-        :return: None
-        """
-        bmi = QLineEdit()
-        bmi.setToolTip(
-            f'BMI is a convenient rule of thumb for categorizing a person as underweight, normal, overweight, or obese.'
-            f'\nWhile helpful broadly across the population, it can fail to account for a person that is very athletic.'
-            f'\nA person with a lot of muscle may skew towards being overweight or even obese on the BMI scale.'
-        )
-        bmi.setReadOnly(True)
-        sizepolicy = QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Minimum)
-        bmi.setMinimumSize(50, 15)
-        bmi.setMaximumSize(150, 25)
-        bmi.setSizePolicy(sizepolicy)
-        bmi.setAlignment(Qt.Alignment.AlignCenter)
-        return bmi
+        self.update_bmi_factor()
+        self.set_bmi()
 
     def set_name(self):
         self.user_name.setText(f'{self.user.name}')
 
     def set_weight(self):
-        self.user_weight.setText(f'{self.user.weight} {self.settings.units}')
+        self.user_weight.setText(f'{round(self.display_weight(self.user.weight), 2)} {self.settings.units}')
 
     def set_goal(self):
-        self.user_goal_weight.setText(f'{self.user.goal} {self.settings.units}')
+        self.user_goal_weight.setText(f'{round(self.display_weight(self.user.goal), 2)} {self.settings.units}')
 
     def set_height(self):
         self.user_height.setText(f'{self.user.height}')
 
+    def update_bmi_factor(self):
+        """
+        Stores the multiplier that turns a weight in the measurement system in use into a body mass index for the
+        user's height, which only changes when the height or the measurement system does.
+        :return: None
+        """
+        self.bmi_factor = 703 / (self.user.height * self.user.height) / self.display_weight(1)
+
     def set_bmi(self):
         if len(self.sorted_weight_list) > 0:
-            self.user_bmi.setText(f'{(self.sorted_weight_list[-1][2] / self.user.height ** 2 * 703):.1f}')
+            self.user_bmi.setText(f'{(self.sorted_weight_list[-1][2] * self.bmi_factor):.1f}')
         else:
-            self.user_bmi.setText(f'Not available.')
+            self.user_bmi.setText('Not available.')
+
+    def labelled_grid_layout(self, rows):
+        """
+        Creates a two column QGridLayout that places a sized QLabel beside each widget provided.
+        :param rows: pairs of label text and the widget it describes, in display order
+        :return: QGridLayout
+        """
+        layout = QGridLayout()
+        for row, (text, widget) in enumerate(rows):
+            label = QLabel(text)
+            label.setMinimumSize(75, 15)
+            label.setMaximumSize(150, 25)
+            label.setSizePolicy(SIZE_POLICY)
+            layout.addWidget(label, row, 0)
+            layout.addWidget(widget, row, 1)
+        return layout
 
     def user_box_properties(self):
         box = QGroupBox('Personal information')
-        box.setStyleSheet("""
-        QGroupBox {
-        font-size: 16px;
-        font-weight: bold;
-        }
-
-        QLabel {
-        font: bold 14px
-        }
-        """)
-        layout = QGridLayout()
-        sizepolicy = QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Minimum)
-        name_label = QLabel('NAME')
-        name_label.setMinimumSize(75, 15)
-        name_label.setMaximumSize(150, 25)
-        name_label.setSizePolicy(sizepolicy)
-        weight_label = QLabel('START WEIGHT')
-        weight_label.setMinimumSize(75, 15)
-        weight_label.setMaximumSize(150, 25)
-        weight_label.setSizePolicy(sizepolicy)
-        goal_label = QLabel('GOAL WEIGHT')
-        goal_label.setMinimumSize(75, 15)
-        goal_label.setMaximumSize(150, 25)
-        goal_label.setSizePolicy(sizepolicy)
-        height_label = QLabel('HEIGHT')
-        height_label.setMinimumSize(75, 15)
-        height_label.setMaximumSize(150, 25)
-        height_label.setSizePolicy(sizepolicy)
-        bmi_label = QLabel('BODY MASS INDEX')
-        bmi_label.setMinimumSize(75, 15)
-        bmi_label.setMaximumSize(150, 25)
-        bmi_label.setSizePolicy(sizepolicy)
-        layout.addWidget(name_label, 0, 0)
-        layout.addWidget(self.user_name, 0, 1)
-        layout.addWidget(weight_label, 1, 0)
-        layout.addWidget(self.user_weight, 1, 1)
-        layout.addWidget(goal_label, 2, 0)
-        layout.addWidget(self.user_goal_weight, 2, 1)
-        layout.addWidget(height_label, 3, 0)
-        layout.addWidget(self.user_height, 3, 1)
-        layout.addWidget(bmi_label, 4, 0)
-        layout.addWidget(self.user_bmi, 4, 1)
+        box.setStyleSheet(GROUP_BOX_STYLE)
+        layout = self.labelled_grid_layout((
+            ('NAME', self.user_name),
+            ('START WEIGHT', self.user_weight),
+            ('GOAL WEIGHT', self.user_goal_weight),
+            ('HEIGHT', self.user_height),
+            ('BODY MASS INDEX', self.user_bmi),
+        ))
         box.setLayout(layout)
         return box
 
-    def net_weight_change(self):
-        net = QLineEdit()
-        net.setReadOnly(True)
-        net.setToolTip('The total weight change you have experienced.')
-        sizepolicy = QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Minimum)
-        net.setMinimumSize(75, 15)
-        net.setMaximumSize(150, 25)
-        net.setSizePolicy(sizepolicy)
-        net.setAlignment(Qt.Alignment.AlignCenter)
-        return net
-
-    def average_weight_change(self):
-        average = QLineEdit()
-        average.setReadOnly(True)
-        average.setToolTip('The average weight change you have experienced per entry.')
-        sizepolicy = QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Minimum)
-        average.setMinimumSize(75, 15)
-        average.setMaximumSize(150, 25)
-        average.setSizePolicy(sizepolicy)
-        average.setAlignment(Qt.Alignment.AlignCenter)
-        return average
-
-    def time_to_goal(self):
-        time = QLineEdit()
-        time.setReadOnly(True)
-        time.setToolTip(
-            f'The amount of days left until you reach your goal '
-            f'should the trajectory of your weight progression '
-            f'remain the same.'
-        )
-        sizepolicy = QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Minimum)
-        time.setMinimumSize(75, 15)
-        time.setMaximumSize(150, 25)
-        time.setSizePolicy(sizepolicy)
-        time.setAlignment(Qt.Alignment.AlignCenter)
-        return time
-
-    def end_date_properties(self):
-        end_date = QLineEdit()
-        end_date.setReadOnly(True)
-        end_date.setToolTip(
-            f'The date upon which you will reach your end goal '
-            f'should the trajectory of your weight progression'
-            f'remain the same.'
-        )
-        sizepolicy = QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Minimum)
-        end_date.setMinimumSize(75, 15)
-        end_date.setMaximumSize(150, 25)
-        end_date.setSizePolicy(sizepolicy)
-        end_date.setAlignment(Qt.Alignment.AlignCenter)
-        return end_date
-
     def weight_box_properties(self):
         box = QGroupBox('Metrics for user weight progression')
-        box.setStyleSheet("""
-        QGroupBox {
-        font-size: 16px;
-        font-weight: bold;
-        }
-        
-        QLabel {
-        font: bold 14px
-        }
-        """)
-        layout = QGridLayout()
-        sizepolicy = QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Minimum)
-        net_change_label = QLabel('NET CHANGE')
-        net_change_label.setMinimumSize(75, 15)
-        net_change_label.setMaximumSize(150, 25)
-        net_change_label.setSizePolicy(sizepolicy)
-        average_label = QLabel('WEIGHT CHANGE')
-        average_label.setMinimumSize(75, 15)
-        average_label.setMaximumSize(150, 25)
-        average_label.setSizePolicy(sizepolicy)
-        days_label = QLabel('GOAL REACHED IN')
-        days_label.setMinimumSize(75, 15)
-        days_label.setMaximumSize(150, 25)
-        days_label.setSizePolicy(sizepolicy)
-        date_label = QLabel('END DATE')
-        date_label.setMinimumSize(75, 15)
-        date_label.setMaximumSize(150, 25)
-        date_label.setSizePolicy(sizepolicy)
-        layout.addWidget(net_change_label, 0, 0, )
-        layout.addWidget(self.net_change, 0, 1)
-        layout.addWidget(average_label, 1, 0)
-        layout.addWidget(self.weight_average, 1, 1)
-        layout.addWidget(days_label, 2, 0)
-        layout.addWidget(self.time_goal, 2, 1)
-        layout.addWidget(date_label, 3, 0)
-        layout.addWidget(self.end_date, 3, 1)
+        box.setStyleSheet(GROUP_BOX_STYLE)
+        layout = self.labelled_grid_layout((
+            ('NET CHANGE', self.net_change),
+            ('WEIGHT CHANGE', self.weight_average),
+            ('GOAL REACHED IN', self.time_goal),
+            ('END DATE', self.end_date),
+        ))
         box.setLayout(layout)
         return box
 
@@ -443,56 +410,45 @@ class MainWidget(QWidget):
                 f'{(self.sorted_weight_list[0][2] - self.sorted_weight_list[-1][2]):.2F} {self.settings.units}'
             )
         else:
-            self.net_change.setText(f'N/A')
+            self.net_change.setText('N/A')
         if self.weight_delta is not None:
             self.weight_average.setText(f'{self.weight_delta:.3f} {self.settings.units}')
             self.time_goal.setText(f'{self.time_goal_data[1]} days')
             self.end_date.setText(f'{self.time_goal_data[0]}')
         else:
-            self.weight_average.setText(f'N/A')
-            self.time_goal.setText(f'N/A')
-            self.end_date.setText(f'N/A.')
+            self.weight_average.setText('N/A')
+            self.time_goal.setText('N/A')
+            self.end_date.setText('N/A.')
 
     def user_history_properties(self):
         """
         Sets the default properties of the user history table.
-        :return: None
+        :return: QTableView
         """
-        hlabel_list = ['ID', 'DATE', 'WEIGHT']
-        self.user_history.setColumnCount(3)
-        self.user_history.setColumnHidden(0, True)
-        self.user_history.setHorizontalHeaderLabels(hlabel_list)
-        self.user_history.setAlternatingRowColors(True)
-        self.user_history.horizontalHeader().setDefaultAlignment(Qt.AlignCenter)
-        self.user_history.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        self.user_history.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.user_history.verticalHeader().setVisible(False)
-        style_sheet = '''
-            QHeaderView::section {
-                border-radius:20px;
-                font-size:20px;
-                font-weight:bold;
-            }
-        '''
-        self.user_history.setStyleSheet(style_sheet)
-
-    def user_history_table(self, table_list):
-        """
-        Sets the items of the user's weight history dynamically into the table.
+        user_history = QTableView()
+        user_history.setModel(self.history_model)
+        user_history.setColumnHidden(0, True)
+        user_history.setAlternatingRowColors(True)
+        user_history.horizontalHeader().setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
+        user_history.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        user_history.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        user_history.verticalHeader().setVisible(False)
+        user_history.setStyleSheet(HEADER_STYLE)
+        user_history.selectionModel().selectionChanged.connect(self.modify_entry_trigger)
+        user_history.selectionModel().selectionChanged.connect(self.delete_entry_trigger)
+        return user_history
+
+    def selected_history_indexes(self):
+        """Returns the model indexes of the cells currently selected in the weight history table."""
+        return self.user_history.selectionModel().selectedIndexes()
+
+    def update_entry_buttons(self):
+        """
+        Re-checks the modify and delete buttons after rows of the table have changed beneath the selection.
         :return: None
         """
-        self.user_history.setRowCount(len(self.sorted_weight_list))
-        for row, items in enumerate(table_list):
-            self.user_history.setItem(row, 0, items[0])
-            self.user_history.setItem(row, 1, items[1])
-            self.user_history.setItem(row, 2, items[2])
-        self.user_history.itemSelectionChanged.connect(self.modify_entry_trigger)
-        self.user_history.itemSelectionChanged.connect(self.delete_entry_trigger)
-
-    def load_user_table(self):
-        self.table_list = model.create_table_list(self.sorted_weight_list)
-        self.user_history.clearContents()
-        self.user_history_table(self.table_list)
+        self.modify_entry_trigger()
+        self.delete_entry_trigger()
 
     def add_entry_button(self):
         """
@@ -506,18 +462,22 @@ class MainWidget(QWidget):
         return add_entry
 
     def add_entry_trigger(self):
-        if self.weight_entry.hasAcceptableInput() is True:
+        if self.weight_entry.hasAcceptableInput():
             self.add_entry.setEnabled(True)
         else:
             self.add_entry.setEnabled(False)
 
     def add_entry_database(self):
         date, weight = self.calendar.selectedDate(), float(self.weight_entry.text())
-        date = date.toString('yyyy-MM-dd')
-        database.insert_weight_entry(date, weight, self.user.user_id)
-        database.load_user_history(self.user)
-        self.update_weight_history()
-        self.load_user_table()
+        date, weight = date.toString('yyyy-MM-dd'), self.stored_weight(weight)
+        entry_id = database.insert_weight_entry(date, weight, self.user.user_id)
+        # The failed insert has already been logged and rolled back, so there is no row to show
+        if entry_id is None:
+            return
+        entry = (entry_id, date, weight)
+        self.user.add_weight_entry(entry)
+        self.insert_sorted_entry(entry)
+        self.update_entry_buttons()
         self.weight_entry.clear()
         self.update_data()
         self.set_progress_metrics()
@@ -527,18 +487,20 @@ class MainWidget(QWidget):
         """
         Sets the default properties of the 'Modify Entry' button. It is enabled when a valid selection on the table
         is made. Clicking the button modifies the entry in the database.
-        :return: None
+        :return: QPushButton
         """
-        self.modify_entry.setText('Modify Entry')
-        self.modify_entry.setEnabled(False)
-        self.modify_entry.clicked.connect(self.modify_entry_database)
+        modify_entry = QPushButton()
+        modify_entry.setText('Modify Entry')
+        modify_entry.setEnabled(False)
+        modify_entry.clicked.connect(self.modify_entry_database)
+        return modify_entry
 
     def modify_entry_trigger(self):
         """
         Checks whether items have been selected on the weight history and enables/disables the modify QPushButton.
         :return:
         """
-        if self.weight_entry.hasAcceptableInput() is True and len(self.user_history.selectedItems()) == 1:
+        if self.weight_entry.hasAcceptableInput() and len(self.selected_history_indexes()) == 1:
             self.modify_entry.setEnabled(True)
         else:
             self.modify_entry.setEnabled(False)
@@ -549,14 +511,15 @@ class MainWidget(QWidget):
         Updates the selected item in the table with the new value for weight and/or date.
         :return: None
         """
-        entry = self.user_history.selectedItems()[0]
-        item_id = self.user_history.item(entry.row(), 0)
+        index = self.selected_history_indexes()[0]
+        entry_id = self.history_model.entry(index.row())[0]
         date, weight = self.calendar.selectedDate(), float(self.weight_entry.text())
-        date = date.toString('yyyy-MM-dd')
-        database.update_weight_entry(item_id.data(0), weight, date)
-        database.load_user_history(self.user)
-        self.update_weight_history()
-        self.load_user_table()
+        date, weight = date.toString('yyyy-MM-dd'), self.stored_weight(weight)
+        database.update_weight_entry(entry_id, weight, date)
+        entry = (entry_id, date, weight)
+        self.user.replace_weight_entry(entry)
+        self.replace_sorted_entry(entry)
+        self.update_entry_buttons()
         self.update_data()
         self.set_progress_metrics()
         self.update_graph()
@@ -565,21 +528,23 @@ class MainWidget(QWidget):
         """
         Sets the default properties of the 'Delete Entry' button. It is enabled when a valid selection on the table
         is made. Clicking the button deletes the entries in the database.
-        :return: None
+        :return: QPushButton
         """
-        self.delete_entry.setText('Delete Entry')
-        self.delete_entry.setEnabled(False)
-        self.delete_entry.clicked.connect(self.delete_entry_dialog)
+        delete_entry = QPushButton()
+        delete_entry.setText('Delete Entry')
+        delete_entry.setEnabled(False)
+        delete_entry.clicked.connect(self.delete_entry_dialog)
+        return delete_entry
 
     def delete_entry_dialog(self):
-        self.dialog = DeleteDialog(self, self.user_history.selectedItems())
+        self.dialog = DeleteDialog(self, self.selected_history_indexes())
 
     def delete_entry_trigger(self):
         """
         Checks whether items have been selected on the weight history and enables/disables the delete QPushButton.
         :return: None
         """
-        if len(self.user_history.selectedItems()) >= 1:
+        if len(self.selected_history_indexes()) >= 1:
             self.delete_entry.setEnabled(True)
         else:
             self.delete_entry.setEnabled(False)
@@ -590,13 +555,12 @@ class MainWidget(QWidget):
         :return: None
         """
         entries = set()
-        for item in entry:
-            item_id = self.user_history.item(item.row(), 0)
-            entries.add(item_id.data(0))
+        for index in entry:
+            entries.add(self.history_model.entry(index.row())[0])
         database.delete_weight_entry(entries)
-        database.load_user_history(self.user)
-        self.update_weight_history()
-        self.load_user_table()
+        self.user.remove_weight_entries(entries)
+        self.remove_sorted_entries(entries)
+        self.update_entry_buttons()
         self.update_data()
         self.set_progress_metrics()
         self.update_graph()
@@ -604,18 +568,38 @@ class MainWidget(QWidget):
     def weight_entry_edit(self):
         """
         Sets the default properties of the weight entry QLineEdit object.
+        :return: QLineEdit
+        """
+        weight_entry = QLineEdit()
+        weight_entry.setPlaceholderText('Type a valid weight into here')
+        weight_entry.setValidator(self.weight_validator)
+        weight_entry.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        weight_entry.textEdited.connect(self.entry_button_timer.start)
+        return weight_entry
+
+    def entry_button_timer_properties(self):
+        """
+        Sets the default properties of the timer that coalesces keystrokes in the weight entry, so the add and modify
+        buttons are re-checked once typing pauses rather than on every key.
+        :return: QTimer
+        """
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(50)
+        timer.timeout.connect(self.weight_entry_trigger)
+        return timer
+
+    def weight_entry_trigger(self):
+        """
+        Checks the typed weight once against the add and modify QPushButtons.
         :return: None
         """
-        self.weight_entry.setPlaceholderText('Type a valid weight into here')
-        validator = QDoubleValidator(0, 1000, 2, self.weight_entry)
-        self.weight_entry.setValidator(validator)
-        self.weight_entry.setAlignment(Qt.Alignment.AlignCenter)
-        self.weight_entry.textEdited.connect(self.add_entry_trigger)
-        self.weight_entry.textEdited.connect(self.modify_entry_trigger)
+        self.add_entry_trigger()
+        self.modify_entry_trigger()
 
     def calendar_widget(self):
         calendar = QCalendarWidget()
-        calendar.setMaximumDate(DATETODAY)
+        calendar.setMaximumDate(datetime.date.today())
         return calendar
 
     def user_graph_properties(self):
@@ -623,87 +607,80 @@ class MainWidget(QWidget):
         Sets the default properties of the graph.
         :return: None
         """
+        import pyqtgraph as pg
+
         axis_label_style = {
             'color': '#FFF',
             'font-size': '14pt',
             'font-weight': 'bold'
         }
-        axis_title = pg.AxisItem(
-            orientation='top',
-            text='Weight Visualizer',
-            **axis_label_style
-        )
-        axis_title.showLabel(show=True)
-        axis_left = pg.AxisItem(
-            orientation='left',
-            text='Weight',
-            **axis_label_style
-        )
-        axis_left.showLabel(show=True)
-        axis_bottom = pg.AxisItem(
-            orientation='bottom',
-            text='Entries',
-            **axis_label_style
-        )
-        axis_bottom.showLabel(show=True)
-        viewbox = pg.ViewBox()
-        user_graph = pg.PlotWidget(
-            viewbox=viewbox,
-            axisItems={
-                'top': axis_title,
-                'left': axis_left,
-                'bottom': axis_bottom
-            }
-        )
-
+        axis_items = {}
+        # Labels are set once through setLabel, which also shows them, rather than through the AxisItem text argument
+        for orientation, text in (('top', 'Weight Visualizer'), ('left', 'Weight'), ('bottom', 'Entries')):
+            axis = pg.AxisItem(orientation=orientation)
+            axis.setLabel(text=text, **axis_label_style)
+            axis_items[orientation] = axis
+        user_graph = pg.PlotWidget(axisItems=axis_items)
+        # Long histories are reduced to what fits on screen, and samples outside the visible range are skipped
+        user_graph.setDownsampling(auto=True, mode='peak')
+        user_graph.setClipToView(True)
         return user_graph
 
+    @property
+    def user_graph(self):
+        """
+        Builds the graph the first time it is needed and swaps it into the layout in place of its placeholder.
+        :return: PlotWidget
+        """
+        if self._user_graph is None:
+            self._user_graph = self.user_graph_properties()
+            # The curves are created once and have their data replaced on every update
+            self.weight_curve = self._user_graph.plot(symbol='o')
+            self.lerp_curve = self._user_graph.plot(symbol='h', symbolBrush='r')
+            self.layout_right.replaceWidget(self.graph_placeholder, self._user_graph)
+            self.graph_placeholder.deleteLater()
+        return self._user_graph
+
     def viewbox_set_limits(self, xMin=None, xMax=None, yMin=None, yMax=None):
         self.user_graph.getViewBox().setLimits(xMin=xMin, xMax=xMax, yMin=yMin, yMax=yMax)
 
     def update_graph(self, days=0, lerp=None):
         self.graph_x, self.graph_y = model.create_graph_list(self.sorted_weight_list, days)
         if len(self.graph_x) > 0:
-            x_max = max(self.graph_x)
-            y_min = min(self.graph_y)
-            y_max = max(self.graph_y)
+            # The x values are the entry positions 0..n-1, so the last one is the maximum
+            x_max = len(self.graph_x) - 1
+            y_min = self.graph_y.min()
+            y_max = self.graph_y.max()
             if lerp is None:
                 self.viewbox_set_limits(
                     xMin=-1, xMax=(x_max + 1),
                     yMin=(y_min - 10), yMax=(y_max + 10)
                 )
                 self.user_graph.setYRange((y_max + 5), (y_min - 5))
-                self.user_graph.plot(self.graph_x, self.graph_y, symbol='o', clear=True)
+                self.weight_curve.setData(self.graph_x, self.graph_y)
+                self.lerp_curve.setData([], [])
             else:
                 lerp_x, lerp_y = model.lerp_weight_entry(
                     lerp, self.graph_y, self.sorted_weight_list[-1][2], self.weight_delta)
-                lerp_y_min = min(self.graph_y + lerp_y)
-                lerp_y_max = max(self.graph_y + lerp_y)
+                # The projection is a straight line, so its extrema are its first and last points
+                lerp_y_min = min(y_min, lerp_y[0], lerp_y[-1])
+                lerp_y_max = max(y_max, lerp_y[0], lerp_y[-1])
                 self.viewbox_set_limits(
-                    xMin=-1, xMax=(len((self.graph_x + lerp_x))),
+                    xMin=-1, xMax=(len(self.graph_x) + len(lerp_x)),
                     yMin=(lerp_y_min - 10), yMax=(lerp_y_max + 10)
                 )
                 self.user_graph.setYRange(
                     (lerp_y_max + (self.weight_delta * days + 1)),
                     (lerp_y_min - (self.weight_delta * days + 1))
                 )
-                self.user_graph.plot(self.graph_x, self.graph_y, symbol='o', clear=True)
-                self.user_graph.plot(lerp_x, lerp_y, symbol='h', symbolBrush='r')
+                self.weight_curve.setData(self.graph_x, self.graph_y)
+                self.lerp_curve.setData(lerp_x, lerp_y)
         else:
             return
 
     def graph_box_properties(self):
         box = QGroupBox('Press a button to change the graph displayed.')
-        box.setStyleSheet("""
-        QGroupBox {
-        font-size: 16px;
-        font-weight: bold;
-        }
-
-        QLabel {
-        font: bold 14px
-        }
-        """)
+        box.setStyleSheet(GROUP_BOX_STYLE)
         box_layout = QHBoxLayout()
         graph_layout = QVBoxLayout()
         lerp_layout = QVBoxLayout()
@@ -754,57 +731,91 @@ class MainWidget(QWidget):
         button.clicked.connect(partial(self.update_graph, days=-15, lerp=28))
         return button
 
-    def set_widget_properties(self):
-        self.user_history_properties()
-        self.weight_entry_edit()
-        self.modify_entry_button()
-        self.delete_entry_button()
-
-    def generate_left_layout(self):
+    def generate_vertical_layout(self, *widgets):
+        """Stacks the provided widgets from top to bottom in a new QVBoxLayout and returns it."""
         layout = QVBoxLayout()
-        layout.addWidget(self.user_box)
-        layout.addWidget(self.weight_box)
+        for widget in widgets:
+            layout.addWidget(widget)
         return layout
 
-    def generate_center_layout(self):
-        layout = QVBoxLayout()
-        layout.addWidget(self.user_history)
-        layout.addWidget(self.add_entry)
-        layout.addWidget(self.modify_entry)
-        layout.addWidget(self.delete_entry)
-        layout.addWidget(self.weight_entry)
-        layout.addWidget(self.calendar)
-        return layout
+    def load_settings(self):
+        """
+        Re-applies the settings after the settings menu has changed them. A new measurement system reconverts the whole
+        weight history and refreshes every value and the graph derived from it.
+        :return: None
+        """
+        self.settings = self.master.settings
+        measurement_system = self.settings.settings['Measurement System']
+        if measurement_system == self.measurement_system:
+            return
+        self.measurement_system = measurement_system
+        self.update_weight_history()
+        self.update_entry_buttons()
+        self.update_data()
+        self.set_weight()
+        self.set_goal()
+        self.update_bmi_factor()
+        self.set_bmi()
+        self.set_progress_metrics()
+        self.update_graph()
 
-    def generate_right_layout(self):
-        layout = QVBoxLayout()
-        layout.addWidget(self.user_graph)
-        layout.addWidget(self.graph_box)
-        return layout
+    def display_weight(self, weight):
+        """Converts a weight stored in pounds to the measurement system in use and returns a float."""
+        return model.convert_weight(weight, self.measurement_system)
 
-    def generate_master_layout(self):
-        layout = QHBoxLayout()
-        layout.addLayout(self.layout_left, 1)
-        layout.addLayout(self.layout_center, 1)
-        layout.addLayout(self.layout_right, 1)
-        return layout
+    def stored_weight(self, weight):
+        """Converts a weight typed in the measurement system in use to pounds for storage and returns a float."""
+        return model.convert_weight_imperial(weight, self.measurement_system)
 
-    def load_settings(self):
-        self.settings = self.master.settings
+    @property
+    def sorted_weight_list(self):
+        """
+        The user's weight history sorted by date and converted to the measurement system in use. It is the list held by
+        the table model, so it is changed only through the model and never reassigned here.
+        :return: List
+        """
+        return self.history_model.rows
 
     def update_weight_history(self):
-        self.sorted_weight_list = model.convert_weight_history(
-            self.user.weight_history, self.settings.settings['Measurement System']
+        """
+        Reconverts the user's whole weight history to the measurement system in use and resets the table model to it.
+        :return: None
+        """
+        self.history_model.set_rows(
+            model.convert_weight_history(self.user.weight_history, self.measurement_system)
         )
 
+    def insert_sorted_entry(self, entry):
+        """
+        Converts a new (ID, date, weight) entry to the measurement system in use and inserts it into the sorted weight
+        history at its date through the table model, without re-sorting the rest of the history.
+        :return: None
+        """
+        entry = model.convert_weight_entry(entry, self.measurement_system)
+        self.history_model.insert_entry(entry)
+
+    def replace_sorted_entry(self, entry):
+        """
+        Converts a modified (ID, date, weight) entry to the measurement system in use and replaces the entry sharing
+        its ID in the sorted weight history through the table model.
+        :return: None
+        """
+        entry = model.convert_weight_entry(entry, self.measurement_system)
+        self.history_model.update_entry(entry)
+
+    def remove_sorted_entries(self, entry_ids):
+        """Removes the entries whose IDs are in the provided collection from the sorted weight history in place."""
+        self.history_model.remove_entries(entry_ids)
+
     def update_weight_delta(self):
         self.weight_delta = model.weight_delta_calculator(self.sorted_weight_list)
 
     def update_time_delta(self):
-        self.time_goal_data = model.time_to_goal(self.sorted_weight_list[-1][2], self.user.goal, self.weight_delta)
+        self.time_goal_data = model.time_to_goal(
+            self.sorted_weight_list[-1][2], self.display_weight(self.user.goal), self.weight_delta
+        )
 
     def update_data(self):
-        self.update_weight_history()
         self.update_weight_delta()
         self.update_time_delta()
 
@@ -820,8 +831,10 @@ class DeleteDialog(QDialog):
         self.label = self.deletion_label()
         self.confirm = self.confirm_button()
         self.cancel = self.cancel_button()
-        self.btn_layout()
-        self.main_layout()
+        self.button_layout.addWidget(self.confirm)
+        self.button_layout.addWidget(self.cancel)
+        self.layout.addWidget(self.label)
+        self.layout.addLayout(self.button_layout)
         self.open()
 
     def deletion_label(self):
@@ -838,24 +851,13 @@ class DeleteDialog(QDialog):
     def cancel_button(self):
         cancel = QPushButton('Cancel')
         cancel.setFixedSize(75, 35)
-        cancel.clicked.connect(self.cancel_event)
+        cancel.clicked.connect(self.close)
         return cancel
 
     def confirm_event(self):
         self.parent.delete_entry_database(self.entry)
         self.close()
 
-    def cancel_event(self):
-        self.close()
-
-    def btn_layout(self):
-        self.button_layout.addWidget(self.confirm)
-        self.button_layout.addWidget(self.cancel)
-
-    def main_layout(self):
-        self.layout.addWidget(self.label)
-        self.layout.addLayout(self.button_layout)
-
 
 class QLineSub(QLineEdit):
 
@@ -874,220 +876,77 @@ class SettingsMenu(QWidget):
         self.parent = parent_window
         self.settings = self.parent.settings
         self.setWindowTitle('Settings')
-        # weight measurement radio buttons
-        self.imperial_button = self.imperial_radio()
-        self.metric_button = self.metric_radio()
-        self.british_button = self.british_radio()
-        # UI theme radio buttons
-        self.light_button = self.light_radio()
-        self.dark_button = self.dark_radio()
-        # graph range radio buttons
-        self.graph_all_button = self.graph_all_radio()
-        self.graph_15_button = self.graph_15_radio()
-        self.graph_30_button = self.graph_30_radio()
-        self.graph_90_button = self.graph_90_radio()
-        # graph future radio buttons
-        self.graph_future_7 = self.future_7_radio()
-        self.graph_future_14 = self.future_14_radio()
-        self.graph_future_28 = self.future_28_radio()
-        self.graph_future_none = self.future_none_radio()
-        # containers for buttons
-        self.measurement_system_group = self.measurement_system_box()
-        self.theme_group = self.theme_box()
-        self.graph_group = self.graph_entry_box()
-        self.graph_future_group = self.graph_future_box()
+        # Set once on the menu, the stylesheet cascades to every group box
+        self.setStyleSheet(SETTINGS_BOX_STYLE)
+        # radio buttons are built the first time the menu is shown
+        self.built = False
+
+    def showEvent(self, event):
+        if not self.built:
+            self.build_menu()
+        event.accept()
+
+    def build_menu(self):
+        """
+        Creates the radio buttons, their group boxes and the layouts of the menu, then sizes the window to fit them.
+        :return: None
+        """
+        self.measurement_system_group, self.theme_group, self.graph_group, self.graph_future_group = (
+            self.settings_box(key, title, options) for key, title, options in SETTINGS_SECTIONS
+        )
         # layouts
-        self.v_layout_1 = self.create_vertical_layout_1()
-        self.v_layout_2 = self.create_vertical_layout_2()
-        self.master_layout = self.create_master_layout()
-        self.show()
+        self.v_layout_1 = QVBoxLayout()
+        self.v_layout_1.addWidget(self.measurement_system_group)
+        self.v_layout_1.addWidget(self.theme_group)
+        self.v_layout_2 = QVBoxLayout()
+        self.v_layout_2.addWidget(self.graph_group)
+        self.v_layout_2.addWidget(self.graph_future_group)
+        self.master_layout = QHBoxLayout(self)
+        self.master_layout.addLayout(self.v_layout_1)
+        self.master_layout.addLayout(self.v_layout_2)
+        self.built = True
+        self.adjustSize()
 
     def closeEvent(self, event):
-        self.settings.write_settings_file()
+        self.settings.write_settings_file_async()
         self.parent.load_settings()
         event.accept()
 
-    def measurement_system_box(self):
-        box = QGroupBox('Select a Measurement System')
-        box.setStyleSheet("""
-        QGroupBox {
-        font-size: 14px;
-        font-weight: bold;
-        }
-        """)
-        layout = QVBoxLayout()
-        layout.addWidget(self.imperial_button)
-        layout.addWidget(self.metric_button)
-        layout.addWidget(self.british_button)
-        box.setLayout(layout)
-        return box
-
-    def imperial_radio(self):
-        button = QRadioButton('Imperial')
-        if self.settings.settings['Measurement System'] == 'Imperial':
-            button.setChecked(True)
-        button.toggled.connect(partial(self.select_measurement_system, 'Imperial'))
-        return button
-
-    def metric_radio(self):
-        button = QRadioButton('Metric')
-        if self.settings.settings['Measurement System'] == 'Metric':
-            button.setChecked(True)
-        button.toggled.connect(partial(self.select_measurement_system, 'Metric'))
-        return button
-
-    def british_radio(self):
-        button = QRadioButton('British Imperial')
-        if self.settings.settings['Measurement System'] == 'British Imperial':
-            button.setChecked(True)
-        button.toggled.connect(partial(self.select_measurement_system, 'British Imperial'))
-        return button
-
-    def select_measurement_system(self, system):
-        self.settings.set_measurement_system(system)
-
-    def theme_box(self):
-        box = QGroupBox('Select a menu theme')
-        box.setStyleSheet("""
-        QGroupBox {
-        font-size: 14px;
-        font-weight: bold;
-        }
-        """)
-        layout = QVBoxLayout()
-        layout.addWidget(self.light_button)
-        layout.addWidget(self.dark_button)
-        box.setLayout(layout)
-        return box
-
-    def light_radio(self):
-        button = QRadioButton('Light')
-        if self.settings.settings['Theme'] == 'Light':
-            button.setChecked(True)
-        button.toggled.connect(partial(self.select_theme, "Light"))
-        return button
-
-    def dark_radio(self):
-        button = QRadioButton('Dark')
-        if self.settings.settings['Theme'] == 'Dark':
-            button.setChecked(True)
-        button.toggled.connect(partial(self.select_theme, "Dark"))
-        return button
-
-    def select_theme(self, theme):
-        self.settings.set_theme(theme)
-
-    def graph_entry_box(self):
-        box = QGroupBox('Select the default graphing range to display')
-        box.setStyleSheet("""
-        QGroupBox {
-        font-size: 14px;
-        font-weight: bold;
-        }
-        """)
-        layout = QVBoxLayout()
-        layout.addWidget(self.graph_15_button)
-        layout.addWidget(self.graph_30_button)
-        layout.addWidget(self.graph_90_button)
-        layout.addWidget(self.graph_all_button)
-        box.setLayout(layout)
-        return box
-
-    def graph_15_radio(self):
-        button = QRadioButton('15 Entries')
-        if self.settings.settings['Default Graph Entry Range'] == '15':
-            button.setChecked(True)
-        button.toggled.connect(partial(self.set_graphing_range, '15'))
-        return button
-
-    def graph_30_radio(self):
-        button = QRadioButton('30 Entries')
-        if self.settings.settings['Default Graph Entry Range'] == '30':
-            button.setChecked(True)
-        button.toggled.connect(partial(self.set_graphing_range, '30'))
-        return button
-
-    def graph_90_radio(self):
-        button = QRadioButton('90 Entries')
-        if self.settings.settings['Default Graph Entry Range'] == '90':
-            button.setChecked(True)
-        button.toggled.connect(partial(self.set_graphing_range, '90'))
-        return button
-
-    def graph_all_radio(self):
-        button = QRadioButton('All')
-        if self.settings.settings['Default Graph Entry Range'] == 'All':
-            button.setChecked(True)
-        button.toggled.connect(partial(self.set_graphing_range, 'All'))
-        return button
-
-    def set_graphing_range(self, entries):
-        self.settings.set_graph_entry_default(entries)
-
-    def graph_future_box(self):
-        box = QGroupBox('Select the default behavior for graphing future entries')
-        box.setStyleSheet("""
-        QGroupBox {
-        font-size: 14px;
-        font-weight: bold;
-        }
-        """)
+    def settings_box(self, key, title, options):
+        """
+        Creates a group box holding a radio button for each option of a setting, with the current value checked.
+        :param key: the settings dictionary key the options select a value for
+        :param title: the title of the group box
+        :param options: pairs of button text and the setting value it selects
+        :return: QGroupBox
+        """
+        box = QGroupBox(title)
         layout = QVBoxLayout()
-        layout.addWidget(self.graph_future_7)
-        layout.addWidget(self.graph_future_14)
-        layout.addWidget(self.graph_future_28)
-        layout.addWidget(self.graph_future_none)
+        group = QButtonGroup(box)
+        current = self.settings.settings[key]
+        for text, value in options:
+            button = QRadioButton(text)
+            if value == current:
+                button.setChecked(True)
+            button.setProperty('setting', key)
+            button.setProperty('value', value)
+            group.addButton(button)
+            layout.addWidget(button)
+        # One connection per section rather than one per button
+        group.buttonToggled.connect(self.select_setting)
         box.setLayout(layout)
         return box
 
-    def future_7_radio(self):
-        button = QRadioButton('7 Entries')
-        if self.settings.settings['Default Graph Future Range'] == '7':
-            button.setChecked(True)
-        button.toggled.connect(partial(self.set_future_graphing_range, '7'))
-        return button
-
-    def future_14_radio(self):
-        button = QRadioButton('14 Entries')
-        if self.settings.settings['Default Graph Future Range'] == '14':
-            button.setChecked(True)
-        button.toggled.connect(partial(self.set_future_graphing_range, '14'))
-        return button
-
-    def future_28_radio(self):
-        button = QRadioButton('28 Entries')
-        if self.settings.settings['Default Graph Future Range'] == '28':
-            button.setChecked(True)
-        button.toggled.connect(partial(self.set_future_graphing_range, '28'))
-        return button
-
-    def future_none_radio(self):
-        button = QRadioButton('Off')
-        if self.settings.settings['Default Graph Future Range'] == 'Off':
-            button.setChecked(True)
-        button.toggled.connect(partial(self.set_future_graphing_range, 'Off'))
-        return button
-
-    def set_future_graphing_range(self, entries):
-        self.settings.set_graph_future_default(entries)
-
-    def create_vertical_layout_1(self):
-        layout = QVBoxLayout()
-        layout.addWidget(self.measurement_system_group)
-        layout.addWidget(self.theme_group)
-        return layout
-
-    def create_vertical_layout_2(self):
-        layout = QVBoxLayout()
-        layout.addWidget(self.graph_group)
-        layout.addWidget(self.graph_future_group)
-        return layout
-
-    def create_master_layout(self):
-        layout = QHBoxLayout(self)
-        layout.addLayout(self.v_layout_1)
-        layout.addLayout(self.v_layout_2)
-        return layout
+    def select_setting(self, button, checked):
+        """
+        Applies the setting value carried by the radio button that was toggled.
+        :param button: the radio button of the section that was toggled
+        :param checked: whether the button was checked, only the newly checked button carries the new value
+        :return: None
+        """
+        if not checked:
+            return
+        self.settings.set_setting(button.property('setting'), button.property('value'))
 
 
 class AboutMenu(QWidget):
@@ -1106,8 +965,8 @@ class AboutMenu(QWidget):
     def author_info(self):
         label = QLabel()
         label.setText(
-            f'Thank you for using the program! I hope it meets your needs.\n '
-            f'If you have any questions or if you run into any errors, please use the contact information below to get answers.'
+            'Thank you for using the program! I hope it meets your needs.\n '
+            'If you have any questions or if you run into any errors, please use the contact information below to get answers.'
         )
         return label
 
@@ -1117,8 +976,13 @@ class NewUserDialog(QDialog):
     def __init__(self, master):
         super().__init__()
         self.master = master
-        self.user = User()
-        self.dialog = self.create_dialog()
+        # Weights are typed in the measurement system in use and stored in pounds
+        self.settings = Settings()
+        # Validators shared by the weight, goal and height QLineEdits
+        self.weight_validator = QDoubleValidator(1, 2000, 2, self)
+        self.height_validator = QDoubleValidator(1, 200, 2, self)
+        self.dialog = QDialog()
+        self.dialog.setWindowTitle('New User Creation')
         self.layout = QVBoxLayout(self.dialog)
         self.button_layout = QHBoxLayout()
         self.label = self.label_properties()
@@ -1126,25 +990,23 @@ class NewUserDialog(QDialog):
         self.weight = self.weight_properties()
         self.goal = self.goal_properties()
         self.height = self.height_properties()
+        # Fields holding acceptable input, updated one field at a time as they are edited
+        self.valid_fields = {
+            field for field in (self.name, self.weight, self.goal, self.height) if field.hasAcceptableInput()
+        }
         self.confirm = self.confirm_button()
         self.cancel = self.cancel_button()
-        self.open_dialog()
-        self.btn_layout()
-        self.main_layout()
+        self.button_layout.addWidget(self.confirm)
+        self.button_layout.addWidget(self.cancel)
+        for widget in (self.label, self.name, self.weight, self.goal, self.height):
+            self.layout.addWidget(widget)
+        self.layout.addLayout(self.button_layout)
         self.dialog.resize(200, 200)
-
-    def create_dialog(self):
-        dialog = QDialog()
-        dialog.setWindowTitle('New User Creation')
-        return dialog
+        self.dialog.open()
 
     def label_properties(self):
         label = QLabel()
-        label.setText(
-            'Welcome to the Weight Tracker and Visualization tool!\n'
-            'Please input your personal details in the boxes below\n'
-            'These details will become the base of your history.\n'
-        )
+        label.setText(WELCOME_TEXT)
         return label
 
     def name_properties(self):
@@ -1154,8 +1016,7 @@ class NewUserDialog(QDialog):
         """
         name = QLineEdit()
         name.setPlaceholderText('Type your name here')
-        name.textEdited.connect(partial(self.user.set_name, name))
-        name.textEdited.connect(self.enable_confirm_btn)
+        name.textEdited.connect(self.field_edited)
         return name
 
     def weight_properties(self):
@@ -1164,11 +1025,9 @@ class NewUserDialog(QDialog):
         :return: None
         """
         weight = QLineEdit()
-        weight.setPlaceholderText('Type your current weight here')
-        validator = QDoubleValidator(1, 2000, 2, weight)
-        weight.setValidator(validator)
-        weight.textEdited.connect(partial(self.user.set_weight, weight))
-        weight.textEdited.connect(self.enable_confirm_btn)
+        weight.setPlaceholderText(f'Type your current weight here ({self.settings.units})')
+        weight.setValidator(self.weight_validator)
+        weight.textEdited.connect(self.field_edited)
         return weight
 
     def goal_properties(self):
@@ -1177,11 +1036,9 @@ class NewUserDialog(QDialog):
         :return: None
         """
         goal = QLineEdit()
-        goal.setPlaceholderText('Type your goal weight here')
-        validator = QDoubleValidator(1, 2000, 2, goal)
-        goal.setValidator(validator)
-        goal.textEdited.connect(partial(self.user.set_goal_weight, goal))
-        goal.textEdited.connect(self.enable_confirm_btn)
+        goal.setPlaceholderText(f'Type your goal weight here ({self.settings.units})')
+        goal.setValidator(self.weight_validator)
+        goal.textEdited.connect(self.field_edited)
         return goal
 
     def height_properties(self):
@@ -1191,10 +1048,8 @@ class NewUserDialog(QDialog):
         """
         height = QLineEdit()
         height.setPlaceholderText('Type your height here')
-        validator = QDoubleValidator(1, 200, 2, height)
-        height.setValidator(validator)
-        height.textEdited.connect(partial(self.user.set_height, height))
-        height.textEdited.connect(self.enable_confirm_btn)
+        height.setValidator(self.height_validator)
+        height.textEdited.connect(self.field_edited)
         return height
 
     def confirm_button(self):
@@ -1207,46 +1062,33 @@ class NewUserDialog(QDialog):
     def cancel_button(self):
         """Creates a button that closes the application if it is clicked."""
         cancel = QPushButton('Cancel')
-        cancel.clicked.connect(self.cancel_event)
+        cancel.clicked.connect(sys.exit)
         return cancel
 
-    def enable_confirm_btn(self):
-        if (self.name.hasAcceptableInput() is True and
-                self.weight.hasAcceptableInput() is True and
-                self.goal.hasAcceptableInput() is True and
-                self.height.hasAcceptableInput() is True):
-            self.confirm.setEnabled(True)
+    def field_edited(self):
+        """
+        Re-checks only the field that was edited and enables the confirm button once all four fields are acceptable.
+        :return: None
+        """
+        field = self.sender()
+        if field.hasAcceptableInput():
+            self.valid_fields.add(field)
         else:
-            self.confirm.setEnabled(False)
+            self.valid_fields.discard(field)
+        self.confirm.setEnabled(len(self.valid_fields) == 4)
 
     def confirm_event(self):
         """
         Instantiates a user object and adds it to the database and then instantiates the main menu with the user
         :return: None
         """
-        user = User(str(self.name.text()), float(self.weight.text()), float(self.goal.text()), int(self.height.text()))
-        database.insert_user(user)
-        user = database.retrieve_user(user_id=1)
+        measurement_system = self.settings.settings['Measurement System']
+        weight = model.convert_weight_imperial(float(self.weight.text()), measurement_system)
+        goal = model.convert_weight_imperial(float(self.goal.text()), measurement_system)
+        user = User(str(self.name.text()), weight, goal, int(self.height.text()))
+        user = database.insert_user(user)
+        # The failed insert has already been logged, the dialog stays open so the details can be confirmed again
+        if user is None:
+            return
         self.master.create_main_menu(user)
-        self.close_dialog()
-
-    def cancel_event(self):
-        sys.exit()
-
-    def open_dialog(self):
-        self.dialog.open()
-
-    def close_dialog(self):
         self.dialog.close()
-
-    def btn_layout(self):
-        self.button_layout.addWidget(self.confirm)
-        self.button_layout.addWidget(self.cancel)
-
-    def main_layout(self):
-        self.layout.addWidget(self.label)
-        self.layout.addWidget(self.name)
-        self.layout.addWidget(self.weight)
-        self.layout.addWidget(self.goal)
-        self.layout.addWidget(self.height)
-        self.layout.addLayout(self.button_layout)
@@ -1,10 +1,9 @@
 import datetime
 import logging
 
-from PyQt6.QtCore import *
-from PyQt6.QtWidgets import *
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
 
-DATETODAY = datetime.date.today()
+HISTORY_LABELS = ('ID', 'DATE', 'WEIGHT')
 
 logger = logging.getLogger(__name__)
 
@@ -33,59 +32,71 @@ def create_sorted_weight_history(weight_history, reverse=False):
     return sorted_list
 
 
+def convert_weight(weight, measurement_system):
+    """Converts a weight in pounds to the measurement system specified and returns a float"""
+    if measurement_system == 'Metric':
+        return convert_weight_metric(weight)
+    if measurement_system == 'British Imperial':
+        return convert_weight_stone(weight)
+    return weight
+
+
+def convert_weight_imperial(weight, measurement_system):
+    """Converts a weight in the measurement system specified back to pounds and returns a float"""
+    if measurement_system == 'Metric':
+        return weight / 0.45359237
+    if measurement_system == 'British Imperial':
+        return weight * 14
+    return weight
+
+
+def convert_weight_entry(entry, measurement_system):
+    """
+    Converts the weight of a single (ID, date, weight) entry to the measurement system specified and returns a tuple
+    """
+    if measurement_system == 'Metric':
+        return entry[0], entry[1], convert_weight_metric(entry[2])
+    if measurement_system == 'British Imperial':
+        return entry[0], entry[1], convert_weight_stone(entry[2])
+    return entry
+
+
 def convert_weight_history(weight_history, measurement_system):
     """Converts and sorts the provided weight history list to the measurement system specified and returns a list"""
-    entry_list = []
-    if measurement_system == 'Metric':
-        for entry in weight_history:
-            weight = convert_weight_metric(entry[2])
-            entry_list.append((entry[0], entry[1], weight))
-    elif measurement_system == 'British Imperial':
-        for entry in weight_history:
-            weight = convert_weight_stone(entry[2])
-            entry_list.append((entry[0], entry[1], weight))
-    else:
-        entry_list = weight_history
+    entry_list = [convert_weight_entry(entry, measurement_system) for entry in weight_history]
     sorted_list = create_sorted_weight_history(entry_list)
     return sorted_list
 
 
-def create_table_list(sorted_list):
+def sorted_entry_position(sorted_list, date):
     """
-    Sorts the user's weight history by date and then creates QTableWidget items for each ID, date, and weight entry.
-    :param sorted_list: user supplied weight history list
-    :return: List: a list of tuples containing ID, date, and weight items
+    Binary searches a weight history sorted by date for the position a new entry on the provided date belongs at.
+    Entries sharing the date stay ahead of the new entry, matching the order a full sort would produce.
+    :param sorted_list: a weight history sorted by date
+    :param date: the date of the new entry
+    :return: int
     """
-    id_date_weight_list = []
-    for entry in reversed(sorted_list):
-        id_item = QTableWidgetItem(0)
-        date_item = QTableWidgetItem(1)
-        weight_item = QTableWidgetItem(2)
-        id_item.setData(0, entry[0])
-        date_item.setData(0, entry[1])
-        weight_item.setData(0, entry[2])
-        id_item.setText(str(entry[0]))
-        date_item.setText(str(entry[1]))
-        weight_item.setText(str(entry[2]))
-        id_item.setTextAlignment(Qt.AlignCenter)
-        date_item.setTextAlignment(Qt.AlignCenter)
-        weight_item.setTextAlignment(Qt.AlignCenter)
-        id_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-        date_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-        weight_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-        id_date_weight = (id_item, date_item, weight_item)
-        id_date_weight_list.append(id_date_weight)
-    return id_date_weight_list
+    low, high = 0, len(sorted_list)
+    while low < high:
+        middle = (low + high) // 2
+        if date < sorted_list[middle][1]:
+            high = middle
+        else:
+            low = middle + 1
+    return low
 
 
 def create_graph_list(sorted_list, days=0):
-    """Creates a list of weights that have been sorted by date in descending order."""
-    graph_xlist = []
-    graph_ylist = []
-    for i, entry in enumerate(sorted_list[days:]):
-        graph_x, graph_y = entry[2], i
-        graph_ylist.append(graph_x)
-        graph_xlist.append(graph_y)
+    """
+    Creates NumPy arrays of entry positions and weights from a weight history sorted by date.
+    :param sorted_list: a weight history sorted by date
+    :param days: a negative number limits the arrays to that many of the most recent entries
+    :return: tuple of the x and y arrays
+    """
+    import numpy as np
+
+    graph_ylist = np.fromiter((entry[2] for entry in sorted_list[days:]), dtype=float)
+    graph_xlist = np.arange(len(graph_ylist))
     return graph_xlist, graph_ylist
 
 
@@ -98,9 +109,10 @@ def create_graph_date_list(sorted_list, days=0):
     """
     graph_xlist = []
     graph_ylist = []
-    date_past = DATETODAY - datetime.timedelta(days=days)
+    today = datetime.date.today()
+    date_past = today - datetime.timedelta(days=days)
     for day in range(days):
-        date = DATETODAY - datetime.timedelta(days=1)
+        date = today - datetime.timedelta(days=1)
         graph_ylist.append(date)
     for entry in sorted_list:
         weight = entry[2], datetime.datetime.strptime(entry[1], '%Y-%m-%d')
@@ -128,7 +140,7 @@ def time_to_goal(current_weight, goal_weight, delta):
     if delta is not None:
         difference = current_weight - goal_weight
         days = abs(int(difference / delta))
-        end_date = DATETODAY + datetime.timedelta(days=days)
+        end_date = datetime.date.today() + datetime.timedelta(days=days)
         return end_date, days
     else:
         return None
@@ -138,7 +150,7 @@ def lerp_weight(days, start_weight, goal_weight, weight_delta):
     day_range = range(days)
     lerp_x_list = []
     lerp_y_list = []
-    date = DATETODAY
+    date = datetime.date.today()
     for day in day_range:
         weight = goal_weight + weight_delta * (start_weight - goal_weight)
         start_weight = weight
@@ -149,12 +161,114 @@ def lerp_weight(days, start_weight, goal_weight, weight_delta):
 
 
 def lerp_weight_entry(days, y_list, start_weight, weight_delta):
-    day_range = range(len(y_list), (len(y_list) + days))
-    lerp_x_list = []
-    lerp_y_list = []
-    for day in day_range:
-        weight = start_weight + weight_delta
-        start_weight = weight
-        lerp_x_list.append(day)
-        lerp_y_list.append(weight)
+    """
+    Projects the weight forward from the last entry, one step of the weight delta per entry.
+    :param days: the number of entries to project
+    :param y_list: the weights being graphed, the projection continues on from their positions
+    :param start_weight: the weight of the last entry
+    :param weight_delta: the weight change per entry
+    :return: tuple of the x and y NumPy arrays
+    """
+    import numpy as np
+
+    lerp_x_list = np.arange(len(y_list), len(y_list) + days)
+    lerp_y_list = start_weight + weight_delta * np.arange(1, days + 1)
     return lerp_x_list, lerp_y_list
+
+
+class WeightHistoryModel(QAbstractTableModel):
+    """Table model that presents the user's sorted weight history with the most recent entry first."""
+
+    def __init__(self, sorted_list):
+        """
+        Initializes the model with the user's weight history.
+        :param sorted_list: the user's weight history sorted by date
+        """
+        super().__init__()
+        self.rows = sorted_list
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(HISTORY_LABELS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """
+        Formats the ID, date, or weight of an entry for display when a view asks for it, so only visible rows are
+        formatted. Any other role is answered with None.
+        """
+        if role == Qt.ItemDataRole.DisplayRole:
+            entry = self.entry(index.row())
+            column = index.column()
+            if column == 0:
+                return str(entry[0])
+            if column == 1:
+                return entry[1]
+            return f'{entry[2]:.2f}'
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return HISTORY_LABELS[section]
+        return None
+
+    def entry(self, row):
+        """Returns the (ID, date, weight) entry displayed on the provided table row."""
+        return self.rows[len(self.rows) - 1 - row]
+
+    def insert_entry(self, entry):
+        """
+        Inserts an entry into the weight history at the position its date sorts to and notifies attached views of the
+        single new row.
+        :param entry: an (ID, date, weight) tuple
+        :return: None
+        """
+        position = sorted_entry_position(self.rows, entry[1])
+        row = len(self.rows) - position
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.rows.insert(position, entry)
+        self.endInsertRows()
+
+    def remove_entries(self, entry_ids):
+        """
+        Removes the entries whose IDs are in the provided collection, notifying attached views one row at a time.
+        :param entry_ids: a collection of entry IDs
+        :return: None
+        """
+        positions = [position for position, entry in enumerate(self.rows) if entry[0] in entry_ids]
+        for position in reversed(positions):
+            row = len(self.rows) - 1 - position
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self.rows[position]
+            self.endRemoveRows()
+
+    def update_entry(self, entry):
+        """
+        Replaces the entry sharing the provided entry's ID. The row is updated in place when its date still sorts to
+        the same position, otherwise it is moved by removing and re-inserting it.
+        :param entry: an (ID, date, weight) tuple
+        :return: None
+        """
+        position = next(position for position, row in enumerate(self.rows) if row[0] == entry[0])
+        previous = self.rows.pop(position)
+        if sorted_entry_position(self.rows, entry[1]) != position:
+            self.rows.insert(position, previous)
+            self.remove_entries({entry[0]})
+            self.insert_entry(entry)
+            return
+        self.rows.insert(position, entry)
+        row = len(self.rows) - 1 - position
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(HISTORY_LABELS) - 1))
+
+    def set_rows(self, sorted_list):
+        """Replaces the weight history presented by the model and notifies attached views."""
+        self.beginResetModel()
+        self.rows = sorted_list
+        self.endResetModel()
@@ -1,9 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
 
 BASE_DIR = Path().resolve()
 INI_FILE = 'settings.ini'
 INI_PATH = BASE_DIR / INI_FILE
+# A single worker keeps background writes in the order they were requested
+SETTINGS_WRITER = ThreadPoolExecutor(max_workers=1)
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +15,8 @@ class Settings:
 
     def __init__(self):
         self.settings = None
+        # The settings as last read from or written to the settings.ini
+        self.written_settings = None
         self.check_settings()
         self.units = self.set_units()
 
@@ -27,11 +32,11 @@ class Settings:
         """
         if INI_PATH.exists():
             self.settings = self.read_settings_file()
-            return
         else:
             self.create_settings_file()
             self.settings = self.create_settings_dictionary()
             self.write_settings_file()
+        self.written_settings = dict(self.settings)
 
     def create_settings_file(self):
         """Creates the settings.ini file. Raises exception if it exists and returns None."""
@@ -43,23 +48,34 @@ class Settings:
         else:
             fcreate.close()
 
-    def write_settings_file(self):
+    def write_settings_file(self, settings=None):
         """Writes the settings dictionary to the settings.ini.
 
-        The contents of the settings dictionary are written to the settings.ini file line by line. An exception is
-        raised if the file does not exist. It will then create a new settings.ini file with a default implementation of
-        the application settings.
+        The contents of the settings dictionary are written to the settings.ini file line by line. The write may run on
+        the settings writer thread, so a failure is only logged and the Settings instance is left untouched.
+        :param settings: a snapshot of the settings to write, the current settings are written if none is provided
         :return: None
         """
+        if settings is None:
+            settings = self.settings
         try:
-            fwrite = open(INI_FILE, 'w', encoding='utf-8')
-        except FileNotFoundError:
-            logger.exception('File not found exception occurred.')
-            self.check_settings()
-        else:
-            with fwrite:
-                for k, v in self.settings.items():
+            with open(INI_FILE, 'w', encoding='utf-8') as fwrite:
+                for k, v in settings.items():
                     fwrite.write(f'{k}:{v} \n')
+        except OSError:
+            logger.exception('Settings file could not be written.')
+
+    def write_settings_file_async(self):
+        """Writes a snapshot of the settings dictionary to the settings.ini on a background thread.
+
+        The snapshot is taken on the calling thread, so later changes to the settings do not race with the write.
+        Nothing is written if the settings match what the settings.ini was last read from or written with.
+        :return: Future or None
+        """
+        if self.settings == self.written_settings:
+            return None
+        self.written_settings = dict(self.settings)
+        return SETTINGS_WRITER.submit(self.write_settings_file, self.written_settings)
 
     def read_settings_file(self):
         """Reads the contents of the settings.ini file.
@@ -91,19 +107,23 @@ class Settings:
 
     def set_measurement_system(self, system='Imperial'):
         """Sets the dictionary value to the measurement system provided and returns None."""
-        self.settings['Measurement System'] = system
+        self.set_setting('Measurement System', system)
 
     def set_theme(self, theme='Light'):
         """Sets the dictionary value to the theme provided and returns None."""
-        self.settings['Theme'] = theme
+        self.set_setting('Theme', theme)
 
     def set_graph_entry_default(self, default='All'):
         """Sets the dictionary value to the range provided and returns None."""
-        self.settings['Default Graph Entry Range'] = default
+        self.set_setting('Default Graph Entry Range', default)
 
     def set_graph_future_default(self, default='Off'):
         """Sets the dictionary value to the range provided and returns None."""
-        self.settings['Default Graph Future Range'] = default
+        self.set_setting('Default Graph Future Range', default)
+
+    def set_setting(self, key, value):
+        """Sets the dictionary value of the key provided and returns None."""
+        self.settings[key] = value
 
     def set_units(self):
         if self.settings['Measurement System'] == 'Imperial':
@@ -4,6 +4,7 @@ class User:
     These statistics are collated to generate useful data, like the trajectory of
     their weight loss/gain.
     """
+    __slots__ = ('user_id', 'name', 'weight', 'height', 'goal', 'weight_history')
 
     def __init__(self, name=None, weight=None, goal=None, height=None,
                  weight_history=None):
@@ -43,3 +44,15 @@ class User:
     def set_weight_history(self, weight_history):
         """Sets the user's weight history to a new list of weight entries."""
         self.weight_history = weight_history
+
+    def add_weight_entry(self, entry):
+        """Adds an (ID, date, weight) entry to the user's weight history."""
+        self.weight_history.append(entry)
+
+    def replace_weight_entry(self, entry):
+        """Replaces the weight history entry that shares the ID of the (ID, date, weight) entry provided."""
+        self.weight_history = [entry if old_entry[0] == entry[0] else old_entry for old_entry in self.weight_history]
+
+    def remove_weight_entries(self, entry_ids):
+        """Removes the weight history entries whose IDs are in the provided collection."""
+        self.weight_history = [entry for entry in self.weight_history if entry[0] not in entry_ids]